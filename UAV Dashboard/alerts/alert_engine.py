@@ -0,0 +1,136 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from datetime import datetime
+import time
+
+from alerts.alert_rule import AlertRule, SlidingCounter, normalize_counts
+from alerts.alert_rules import ALERT_RULES
+
+
+class AlertEngine(QObject):
+    """Turns per-frame detection counts into stable, deduplicated alert events."""
+
+    alert_event = pyqtSignal(dict)
+
+    def __init__(self, rules=None, summary_window=3.0):
+        super().__init__()
+        self.rule_configs = ALERT_RULES if rules is None else rules
+        self.summary_window = summary_window
+        self.rules = []
+        self.running = False  # Detections are ignored until start() is called
+        self.reset()
+
+    def start(self):
+        """Start accepting detections."""
+        self.running = True
+
+    def stop(self):
+        """Stop accepting detections and clear the rule state."""
+        # Frames queued from the camera thread may still arrive after this
+        self.running = False
+        self.reset_state()
+
+    def reset(self):
+        """Start a new session: clear the event history as well as the rule state."""
+        self.reset_state()
+        self.events = []  # History of raised/cleared events for the report
+
+    def reset_state(self):
+        """Clear active alerts and windowed counts, keeping the event history."""
+        # Active alerts are cleared explicitly so listeners can undo their triggers
+        for rule in self.rules:
+            if rule.active:
+                rule.active = False
+                self.emit_event(rule, "cleared")
+        self.rules = [AlertRule(config) for config in self.rule_configs]
+        self.class_counters = {}  # Class name -> SlidingCounter for the summary
+
+    def update(self, detected_objects, now=None):
+        """Process the detection counts of one frame."""
+        if not self.running:
+            return
+        if now is None:
+            now = time.monotonic()
+
+        # Every known class gets a sample each frame so the windows stay aligned
+        for name in detected_objects:
+            if name not in self.class_counters:
+                self.class_counters[name] = SlidingCounter(self.summary_window)
+        for name, counter in self.class_counters.items():
+            counter.add(now, detected_objects.get(name, 0))
+
+        # Rules match class names case-insensitively
+        counts = normalize_counts(detected_objects)
+        for rule in self.rules:
+            state = rule.update(now, rule.count(counts))
+            if state is not None:
+                self.emit_event(rule, state)
+
+    def tick(self, now=None):
+        """Expire old frames and re-check rules when no frames are arriving."""
+        if now is None:
+            now = time.monotonic()
+        for rule in self.rules:
+            state = rule.tick(now)
+            if state is not None:
+                self.emit_event(rule, state)
+
+    def emit_event(self, rule, state):
+        """Record a rule transition and notify listeners."""
+        event = {
+            "rule": rule.name,
+            "state": state,
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "value": rule.value,
+            "message": rule.message,
+            "label": rule.label,
+            "color": rule.color,
+            "priority": rule.priority,
+            "record": rule.record,
+        }
+        self.events.append(event)
+        self.alert_event.emit(event)
+
+    def rule(self, name):
+        """Return the named rule, or None if it is not configured."""
+        for rule in self.rules:
+            if rule.name == name:
+                return rule
+        return None
+
+    def is_active(self, name):
+        """Return True if the named rule currently has an active alert."""
+        rule = self.rule(name)
+        return rule is not None and rule.active
+
+    def active_alerts(self):
+        """Return the active rules, highest priority first."""
+        return sorted((rule for rule in self.rules if rule.active), key=lambda rule: -rule.priority)
+
+    def summary(self, now=None):
+        """Return the average count per frame of each class over the summary window."""
+        if now is None:
+            now = time.monotonic()
+        averages = {}
+        for name, counter in self.class_counters.items():
+            counter.expire(now)
+            value = counter.value("mean")
+            if value > 0:
+                averages[name] = value
+        return averages
+
+    def rule_summary(self, name, now=None):
+        """Return the average count of each of a rule's classes over frames where it was seen."""
+        rule = self.rule(name)
+        if rule is None:
+            return {}
+        if now is None:
+            now = time.monotonic()
+        counts = {}
+        for class_name, counter in self.class_counters.items():
+            if class_name.lower() not in rule.classes:
+                continue
+            counter.expire(now)
+            value = counter.mean_when_present()
+            if value > 0:
+                counts[class_name] = value
+        return counts
@@ -0,0 +1,155 @@
+from collections import deque
+
+METRICS = ("mean", "presence", "rate")
+
+
+def normalize_counts(detected_objects):
+    """Sum detection counts by lower-cased class name."""
+    counts = {}
+    for obj_name, obj_count in detected_objects.items():
+        key = obj_name.lower()
+        counts[key] = counts.get(key, 0) + obj_count
+    return counts
+
+
+def recording_action(event, active_rules, camera_running, is_recording, auto_recording):
+    """Return "start", "stop" or None for the recorder after an alert event."""
+    if not event["record"]:
+        return None
+    recording_needed = any(rule.record for rule in active_rules)
+    if recording_needed and camera_running and not is_recording:
+        return "start"
+    # Only recordings started by an alert are stopped by one
+    if not recording_needed and auto_recording and is_recording:
+        return "stop"
+    return None
+
+
+class SlidingCounter:
+    """Running totals of per-frame counts over a sliding time window."""
+
+    def __init__(self, window, appear_gap=1.0):
+        self.window = window
+        self.appear_gap = appear_gap  # Absence needed before a detection counts as a new arrival
+        self.samples = deque()  # (timestamp, count, appeared) for every frame in the window
+        self.total = 0  # Sum of counts in the window
+        self.present = 0  # Frames in the window with a non-zero count
+        self.appeared = 0  # Objects that arrived after being absent for appear_gap
+        self.last_seen = None  # Timestamp of the last frame with a non-zero count
+
+    def add(self, now, count):
+        """Add one frame's count and drop frames that left the window."""
+        appeared = 0
+        if count > 0:
+            # Short dropouts from the detector are not new arrivals
+            if self.last_seen is None or now - self.last_seen > self.appear_gap:
+                appeared = count
+            self.last_seen = now
+        self.samples.append((now, count, appeared))
+        self.total += count
+        self.appeared += appeared
+        if count > 0:
+            self.present += 1
+        self.expire(now)
+
+    def expire(self, now):
+        """Drop frames older than the window."""
+        while self.samples and now - self.samples[0][0] > self.window:
+            _, count, appeared = self.samples.popleft()
+            self.total -= count
+            self.appeared -= appeared
+            if count > 0:
+                self.present -= 1
+
+    def coverage(self):
+        """Return the share of the window spanned by the frames in it."""
+        if not self.samples:
+            return 0.0
+        return (self.samples[-1][0] - self.samples[0][0]) / self.window
+
+    def mean_when_present(self):
+        """Return the average count over frames with at least one detection."""
+        if self.present == 0:
+            return 0.0
+        return self.total / self.present
+
+    def value(self, metric):
+        """Return the windowed metric value."""
+        if metric == "rate":
+            return self.appeared / self.window
+        frames = len(self.samples)
+        if frames == 0:
+            return 0.0
+        if metric == "mean":
+            return self.total / frames
+        return self.present / frames  # presence
+
+
+class AlertRule:
+    """Hysteresis and minimum-duration state for a single configured rule."""
+
+    def __init__(self, config):
+        self.name = config["name"]
+        self.classes = tuple(name.lower() for name in config["classes"])
+        self.metric = config.get("metric", "mean")
+        self.raise_above = config["raise_above"]
+        self.clear_below = config.get("clear_below", self.raise_above)
+        self.min_duration = config.get("min_duration", 0.0)
+        self.clear_duration = config.get("clear_duration", self.min_duration)
+        self.min_coverage = config.get("min_coverage", 0.5)
+        self.message = config.get("message", "")
+        self.label = self.message or self.name.replace("_", " ").capitalize()
+        self.color = config.get("color", "black")
+        self.priority = config.get("priority", 0)
+        self.record = config.get("record", False)
+
+        if self.metric not in METRICS:
+            raise ValueError(f"Alert rule '{self.name}': unknown metric '{self.metric}'")
+        if self.clear_below > self.raise_above:
+            raise ValueError(f"Alert rule '{self.name}': clear_below must not exceed raise_above")
+
+        self.counter = SlidingCounter(config.get("window", 3.0), config.get("appear_gap", 1.0))
+        self.active = False
+        self.value = 0.0
+        self.pending_since = None  # When the metric first crossed the opposite threshold
+
+    def count(self, counts):
+        """Return the combined count of this rule's classes from normalized counts."""
+        return sum(counts.get(name, 0) for name in self.classes)
+
+    def update(self, now, count):
+        """Feed one frame's count and return "raised", "cleared" or None."""
+        self.counter.add(now, count)
+        return self.evaluate(now)
+
+    def tick(self, now):
+        """Re-check the rule without a new frame, e.g. while the stream is stalled."""
+        # Only frames can raise an alert; ticks just let active alerts expire
+        if not self.active:
+            return None
+        self.counter.expire(now)
+        return self.evaluate(now)
+
+    def evaluate(self, now):
+        """Apply hysteresis and minimum durations to the current window."""
+        self.value = self.counter.value(self.metric)
+
+        if self.active:
+            crossed = self.value < self.clear_below
+            hold = self.clear_duration
+        else:
+            # A few frames are not enough evidence to raise an alert
+            crossed = self.value > self.raise_above and self.counter.coverage() >= self.min_coverage
+            hold = self.min_duration
+
+        if not crossed:
+            self.pending_since = None
+            return None
+        if self.pending_since is None:
+            self.pending_since = now
+        if now - self.pending_since < hold:
+            return None
+
+        self.pending_since = None
+        self.active = not self.active
+        return "raised" if self.active else "cleared"
@@ -0,0 +1,85 @@
+# Alert rules evaluated by the AlertEngine over sliding time windows.
+#
+# Each rule watches one or more detection classes (matched case-insensitively)
+# and turns their combined per-frame count into one of these metrics:
+#   "mean"     - average objects per frame in the window
+#   "presence" - fraction of frames in the window with at least one detection
+#   "rate"     - arrivals per second over the window, where objects count as
+#                arriving only after the classes were absent for "appear_gap"
+#                seconds (so detector dropouts and the frame rate do not matter)
+#
+# An alert is raised once the metric stays above "raise_above" for
+# "min_duration" seconds and cleared once it stays below "clear_below" for
+# "clear_duration" seconds. Frames must span at least "min_coverage" of the
+# window before an alert can be raised. Keeping "clear_below" under "raise_above" gives
+# the hysteresis band that stops alerts from flickering between frames.
+#
+# Optional keys:
+#   "message"  - text shown in the emergency teams label and reports
+#   "color"    - color used for the alert in the dashboard
+#   "priority" - higher priority alerts win the emergency teams label
+#   "record"   - start recording automatically while the alert is active
+#   "appear_gap"   - seconds of absence before a detection is a new arrival (default 1.0)
+#   "min_coverage" - share of the window frames must span before raising (default 0.5)
+
+ALERT_RULES = [
+    {
+        "name": "fire_detected",
+        "classes": ["fire"],
+        "metric": "presence",
+        "window": 3.0,
+        "raise_above": 0.5,
+        "clear_below": 0.2,
+        "min_duration": 1.0,
+        "clear_duration": 2.0,
+    },
+    {
+        "name": "fire_disaster",
+        "classes": ["fire"],
+        "metric": "mean",
+        "window": 3.0,
+        "raise_above": 5,
+        "clear_below": 3,
+        "min_duration": 1.0,
+        "clear_duration": 3.0,
+        "message": "Fire truck and other emergency teams required",
+        "color": "blue",
+        "priority": 1,
+        "record": True,
+    },
+    {
+        "name": "other_disaster",
+        "classes": ["smoke", "flood", "earthquake"],
+        "metric": "presence",
+        "window": 3.0,
+        "raise_above": 0.5,
+        "clear_below": 0.2,
+        "min_duration": 1.0,
+        "clear_duration": 2.0,
+    },
+    {
+        "name": "survivors",
+        "classes": ["person"],
+        "metric": "presence",
+        "window": 3.0,
+        "raise_above": 0.6,
+        "clear_below": 0.3,
+        "min_duration": 1.0,
+        "clear_duration": 3.0,
+        "message": "Survivors detected, send emergency teams",
+        "color": "red",
+        "priority": 2,
+        "record": True,
+    },
+    {
+        "name": "emergency_vehicles",
+        "classes": ["ambulance", "fire-truck", "police-car"],
+        "metric": "rate",
+        "window": 10.0,
+        "appear_gap": 2.0,
+        "raise_above": 0.15,  # Two or more vehicles arrived within the window
+        "clear_below": 0.05,  # No vehicle arrived within the window
+        "min_duration": 0.0,
+        "clear_duration": 5.0,
+    },
+]
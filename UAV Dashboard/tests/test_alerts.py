@@ -0,0 +1,171 @@
+import pytest
+
+from alerts.alert_rule import AlertRule, SlidingCounter, normalize_counts, recording_action
+from alerts.alert_rules import ALERT_RULES
+
+
+def make_rule(**overrides):
+    config = {
+        "name": "fire_detected",
+        "classes": ["Fire"],
+        "metric": "presence",
+        "window": 2.0,
+        "raise_above": 0.5,
+        "clear_below": 0.2,
+        "min_duration": 1.0,
+        "clear_duration": 1.0,
+    }
+    config.update(overrides)
+    return AlertRule(config)
+
+
+def feed(rule, start, end, count, fps=10):
+    """Feed a constant count from start to end seconds and collect transitions."""
+    states = []
+    for i in range(int(start * fps), int(end * fps)):
+        now = i / fps
+        state = rule.update(now, count)
+        if state is not None:
+            states.append((now, state))
+    return states
+
+
+def test_counter_evicts_frames_outside_window():
+    counter = SlidingCounter(1.0)
+    counter.add(0.0, 3)
+    counter.add(0.5, 0)
+    assert counter.value("mean") == 1.5
+    assert counter.value("presence") == 0.5
+
+    counter.add(1.6, 1)
+    assert len(counter.samples) == 1
+    assert counter.total == 1
+    assert counter.present == 1
+
+
+def test_rate_counts_arrivals_not_frames():
+    counter = SlidingCounter(10.0, appear_gap=1.0)
+    for i in range(100):  # One object in view for 10 seconds at 10 fps
+        counter.add(i / 10, 1)
+    assert counter.value("rate") == pytest.approx(0.1)
+
+
+def test_rate_ignores_detector_dropouts():
+    counter = SlidingCounter(10.0, appear_gap=1.0)
+    for i in range(100):  # Missed on every 5th frame
+        counter.add(i / 10, 0 if i % 5 == 4 else 1)
+    assert counter.appeared == 1
+
+    for i in range(100, 120):  # Out of view for 2 seconds, then back
+        counter.add(i / 10, 0)
+    counter.add(12.0, 1)
+    assert counter.appeared == 1  # The first arrival has left the window, the new one counts
+
+
+def test_rule_counts_classes_case_insensitively():
+    rule = make_rule(classes=["Smoke", "flood"])
+    counts = normalize_counts({"smoke": 1, "Smoke": 2, "Flood": 1, "Fire": 4})
+    assert counts == {"smoke": 3, "flood": 1, "fire": 4}
+    assert rule.count(counts) == 4
+
+
+def test_rule_raises_after_min_duration():
+    rule = make_rule()
+    states = feed(rule, 0.0, 3.0, 1)
+    assert len(states) == 1
+    raised_at, state = states[0]
+    assert state == "raised"
+    # Frames must cover half the window (1s), then the alert must hold for min_duration
+    assert raised_at == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize("name", ["survivors", "fire_detected"])
+def test_single_detection_does_not_raise(name):
+    config = next(config for config in ALERT_RULES if config["name"] == name)
+    rule = AlertRule(config)
+    assert rule.update(100.0, 1) is None
+    for second in range(1, 10):
+        assert rule.tick(100.0 + second) is None
+    assert not rule.active
+
+
+def test_rule_does_not_flicker_inside_hysteresis_band():
+    rule = make_rule()
+    feed(rule, 0.0, 3.0, 1)
+    assert rule.active
+
+    # Every third frame has a detection: presence ~0.33, between clear_below and raise_above
+    states = []
+    for i in range(30, 100):
+        state = rule.update(i / 10, 1 if i % 3 == 0 else 0)
+        if state is not None:
+            states.append(state)
+    assert states == []
+    assert rule.active
+
+
+def test_rule_clears_after_clear_duration():
+    rule = make_rule()
+    feed(rule, 0.0, 3.0, 1)
+    states = feed(rule, 3.0, 8.0, 0)
+    assert len(states) == 1
+    cleared_at, state = states[0]
+    assert state == "cleared"
+    # Presence drops below 0.2 after ~1.6s of empty frames, then must hold for clear_duration
+    assert cleared_at == pytest.approx(3.0 + 1.6 + 1.0, abs=0.11)
+
+
+def test_rule_clears_on_tick_without_frames():
+    rule = make_rule()
+    feed(rule, 0.0, 3.0, 1)
+    assert rule.tick(5.5) is None  # Window is empty, clear is pending
+    assert rule.tick(6.5) == "cleared"
+
+
+def test_rule_rejects_inverted_thresholds():
+    with pytest.raises(ValueError):
+        make_rule(raise_above=0.2, clear_below=0.5)
+
+
+def test_engine_records_events_and_clears_on_reset_state():
+    pytest.importorskip("PyQt5")
+    from alerts.alert_engine import AlertEngine
+
+    engine = AlertEngine(rules=[{
+        "name": "survivors", "classes": ["person"], "metric": "presence",
+        "window": 2.0, "raise_above": 0.5, "clear_below": 0.2,
+        "min_duration": 1.0, "message": "Survivors detected",
+    }])
+    received = []
+    engine.alert_event.connect(received.append)
+
+    engine.update({"Person": 1}, now=0.0)  # Ignored until the engine is started
+    assert engine.class_counters == {}
+    engine.start()
+
+    for i in range(21):
+        engine.update({"Person": 1}, now=i / 10)
+    assert [event["state"] for event in received] == ["raised"]
+    assert received[0]["label"] == "Survivors detected"
+
+    engine.stop()
+    engine.update({"Person": 1}, now=2.1)  # Frame queued before the camera stopped
+    assert [event["state"] for event in engine.events] == ["raised", "cleared"]
+    assert engine.active_alerts() == []
+
+    engine.reset()
+    assert engine.events == []
+
+
+def test_recording_action():
+    record_event = {"record": True}
+    survivors = make_rule(name="survivors", record=True)
+    survivors.active = True
+
+    assert recording_action(record_event, [survivors], True, False, False) == "start"
+    assert recording_action(record_event, [survivors], False, False, False) is None
+    assert recording_action({"record": False}, [], True, True, True) is None
+
+    # After the last recording alert clears, only an alert-started recording stops
+    assert recording_action(record_event, [], True, True, False) is None
+    assert recording_action(record_event, [], True, True, True) == "stop"
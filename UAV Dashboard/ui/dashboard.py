@@ -11,6 +11,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QPixmap, QImage, QFont
 from camera.camera_view import CameraView
+from alerts.alert_engine import AlertEngine
+from alerts.alert_rule import recording_action
 from ping3 import ping  
 from fpdf import FPDF
 from PIL import Image
@@ -25,10 +27,20 @@ class DroneDashboard(QWidget):
 
         self.camera = CameraView()
         self.camera.frame_updated.connect(self.update_camera_view)
-        self.camera.objects_detected.connect(self.update_live_reporting)
+
+        # Alerts are derived from sliding windows of detections, not single frames
+        self.alert_engine = AlertEngine()
+        self.camera.objects_detected.connect(self.alert_engine.update)
+        self.alert_engine.alert_event.connect(self.handle_alert_event)
+
+        # Timer that expires alerts when no frames arrive (stalls, reconnects)
+        self.alert_timer = QTimer(self)
+        self.alert_timer.timeout.connect(self.alert_engine.tick)
+        self.alert_timer.start(1000)  # Check every 1 second
 
         self.camera_running = False
         self.is_recording = False
+        self.auto_recording = False  # Recording started by an alert rather than the user
 
         # Ping-related attributes
         self.ping_ip = "192.168.4.1"  # ESP32-CAM IP address
@@ -170,6 +182,8 @@ class DroneDashboard(QWidget):
         if self.camera_running:
             # Stop the camera
             self.camera.stop()
+            self.alert_engine.stop()  # Keep the event history for the report
+            self.update_alert_labels()
             self.live_reporting.append("<span style='color: red;'>Camera Stopped.</span>")
             self.camera_status.setText("Camera Status: <span style='color: red;'>Offline</span>")
             self.camera_toggle_btn.setText("Start Camera")
@@ -177,8 +191,10 @@ class DroneDashboard(QWidget):
             # Stop the live reporting timer
             self.report_timer.stop()
         else:
-            # Start the camera
+            # Start the camera and a new alert session
+            self.alert_engine.reset()
             self.camera.start()
+            self.alert_engine.start()
             self.live_reporting.append("<span style='color: green;'>Camera Started.</span>")
             self.camera_status.setText("Camera Status: <span style='color: green;'>Online</span>")
             self.camera_toggle_btn.setText("Stop Camera")
@@ -210,9 +226,13 @@ class DroneDashboard(QWidget):
 
             # Stop the camera and attempt to reconnect after a delay
             self.camera.stop()
+            self.alert_engine.stop()
+            self.update_alert_labels()
             QTimer.singleShot(self.reconnect_delay * 1000, self.reconnect_camera)
         else:
             self.live_reporting.append("<span style='color: red;'>Max reconnection attempts reached. Please check the ESP32-CAM.</span>")
+            self.alert_engine.stop()
+            self.update_alert_labels()
             self.camera_running = False
             self.camera_toggle_btn.setText("Start Camera")
             self.camera_status.setText("Camera Status: <span style='color: red;'>Offline</span>")
@@ -221,6 +241,7 @@ class DroneDashboard(QWidget):
         """Reconnect to the ESP32-CAM stream."""
         try:
             self.camera.start()
+            self.alert_engine.start()
             self.live_reporting.append("<span style='color: green;'>Reconnection successful.</span>")
             self.camera_running = True
             self.camera_toggle_btn.setText("Stop Camera")
@@ -229,82 +250,86 @@ class DroneDashboard(QWidget):
         except Exception as e:
             self.handle_stream_error(e)
 
-    def update_live_reporting(self, detected_objects=None):
-        """Update the live reporting section with detected objects and counts."""
+    def update_live_reporting(self):
+        """Update the live reporting section with the windowed detection summary."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.live_reporting.append(f"<br><span style='color: blue;'>Live Update at {timestamp}:</span>")
 
-        # If no detected_objects are provided, initialize an empty dictionary
-        if detected_objects is None:
-            detected_objects = {}
-
-        # Count total objects
-        total_count = sum(detected_objects.values())
-
-        # Check for fire and other disasters
-        fire_detected = False
-        fire_count = 0
-        other_disasters = []
-        survivors_count = 0
-
-        # List to store detected objects and their counts
-        detected_objects_list = []
-
-        for obj_name, obj_count in detected_objects.items():
-            # Add object name and count to the list
-            detected_objects_list.append(f"{obj_name}: {obj_count}")
-
-            # Check for specific objects
-            if obj_name.lower() == 'fire':
-                fire_detected = True
-                fire_count += obj_count
-            elif obj_name.lower() in ['smoke', 'flood', 'earthquake']:
-                other_disasters.append(f"{obj_name} {obj_count}")
-            elif obj_name.lower() == 'person':
-                survivors_count += obj_count
-
-        # Append total objects detected
+        # Average objects per frame over the engine's summary window
+        summary = self.alert_engine.summary()
+        total_count = round(sum(summary.values()))
         self.live_reporting.append(f"<b>Total Objects Detected:</b> {total_count}")
 
-        # Append list of detected objects with their counts
-        if detected_objects_list:
+        if summary:
             self.live_reporting.append("<b>Detected Objects:</b>")
-            for obj in detected_objects_list:
-                self.live_reporting.append(f"- {obj}")
+            for obj_name, obj_count in summary.items():
+                self.live_reporting.append(f"- {obj_name}: {obj_count:.1f}")
         else:
             self.live_reporting.append("<b>Detected Objects:</b> None")
 
-        # Append fire detection status
-        self.live_reporting.append(f"<b>Fire Detected:</b> {'Yes' if fire_detected else 'No'}")
+        active = self.alert_engine.active_alerts()
+        active_text = ', '.join(rule.name for rule in active) if active else 'None'
+        self.live_reporting.append(f"<b>Active Alerts:</b> {active_text}")
 
-        # Append other disasters
-        disaster_text = ', '.join(other_disasters) if other_disasters else 'None'
-        self.live_reporting.append(f"<b>Other Disasters:</b> {disaster_text}")
+        self.update_alert_labels()
 
-        # Append survivors detected
-        self.live_reporting.append(f"<b>Survivors Detected:</b> {survivors_count}")
+    def update_alert_labels(self):
+        """Update the alert labels from the alert engine state."""
+        summary = self.alert_engine.summary()
+        self.object_count_label.setText(f"Objects detected: {round(sum(summary.values()))}")
 
-        # Update labels
-        self.object_count_label.setText(f"Objects detected: {total_count}")
+        fire_detected = self.alert_engine.is_active("fire_detected")
         self.fire_alert_label.setText(f"Fire detected: {'Yes' if fire_detected else 'No'}")
-        self.disaster_alert_label.setText(f"Other disasters: {disaster_text}")
+
+        # Survivor count follows the survivors alert so the two labels never disagree
+        survivors_count = 0
+        if self.alert_engine.is_active("survivors"):
+            survivors_count = max(1, round(sum(self.alert_engine.rule_summary("survivors").values())))
         self.survivors_alert_label.setText(f"Survivors detected: {survivors_count}")
 
-        # Emergency teams alert
-        if fire_count > 5:
+        if self.alert_engine.is_active("fire_disaster"):
             self.disaster_alert_label.setText("Disaster type: Fire disaster")
-            self.emergency_teams_alert_label.setText("<span style='color: blue;'>Alerts: Fire truck and other emergency teams required</span>")
+        elif self.alert_engine.is_active("other_disaster"):
+            other_disasters = [
+                f"{obj_name} {round(obj_count)}"
+                for obj_name, obj_count in self.alert_engine.rule_summary("other_disaster").items()
+            ]
+            self.disaster_alert_label.setText(f"Other disasters: {', '.join(other_disasters) or 'Detected'}")
+        else:
+            self.disaster_alert_label.setText("Other disasters: None")
+
+        # Highest priority alert with a message owns the emergency teams label
+        for rule in self.alert_engine.active_alerts():
+            if rule.message:
+                self.emergency_teams_alert_label.setText(f"<span style='color: {rule.color};'>Alerts: {rule.message}</span>")
+                break
         else:
-            self.disaster_alert_label.setText("Disaster type: Other disaster")
             self.emergency_teams_alert_label.setText("Emergency teams: Not required")
 
-        if survivors_count > 0:
-            self.emergency_teams_alert_label.setText("<span style='color: red;'>Alerts: Survivors detected, send emergency teams</span>")
+    def handle_alert_event(self, event):
+        """Log an alert transition and apply its recording trigger."""
+        if event["state"] == "raised":
+            self.live_reporting.append(f"<span style='color: {event['color']};'><b>Alert raised:</b> {event['label']}</span>")
+        else:
+            self.live_reporting.append(f"<span style='color: green;'><b>Alert cleared:</b> {event['label']}</span>")
+
+        self.update_alert_labels()
+
+        action = recording_action(
+            event, self.alert_engine.active_alerts(),
+            self.camera_running, self.is_recording, self.auto_recording
+        )
+        if action == "start":
+            self.toggle_recording()
+            self.auto_recording = True
+        elif action == "stop":
+            self.toggle_recording()
 
     def toggle_recording(self):
         """Toggle video recording."""
         self.camera.toggle_recording()
         self.is_recording = not self.is_recording
+        self.auto_recording = False
         if self.is_recording:
             self.record_btn.setText("Stop Recording")
             self.live_reporting.append("<span style='color: green;'>Recording started.</span>")
@@ -355,6 +380,13 @@ class DroneDashboard(QWidget):
             pdf.cell(200, 10, txt=alert, ln=1, align='L')
         pdf.ln(10)
 
+        # Alert Events
+        if self.alert_engine.events:
+            pdf.cell(200, 10, txt="Alert Events:", ln=1, align='L')
+            for event in self.alert_engine.events:
+                pdf.multi_cell(0, 7, txt=f"{event['time']} - {event['state'].capitalize()}: {event['label']}")
+            pdf.ln(10)
+
         # Live Reporting Logs
         pdf.cell(200, 10, txt="Live Reporting Logs:", ln=1, align='L')
         live_text = self.live_reporting.toPlainText().split('\n')